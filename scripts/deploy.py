@@ -1,13 +1,78 @@
 #!/usr/bin/env python3
 
 import os
+import sys
 import json
 import time
-import requests
-from datetime import datetime
-from web3 import Web3
-from eth_account import Account
-from solcx import compile_source, install_solc, set_solc_version
+import hashlib
+import logging
+import functools
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Deployment summary written after every run
+DEPLOYMENT_RESULT_PATH = 'deployment_result.json'
+
+# Compiled contract outputs, keyed by a hash of the source and compiler settings
+COMPILE_CACHE_DIR = '.solc_cache'
+
+# Compiler binaries already resolved in this process, by version
+_solc_executables = {}
+
+@functools.lru_cache(maxsize=None)
+def _solcx():
+    """Import solcx on first use, switching its JSON parsing to orjson"""
+    import solcx
+    import solcx.main
+    
+    # Let solcx parse solc's (large) JSON output with orjson instead of stdlib json
+    solcx.main.json = SimpleNamespace(loads=orjson.loads, dumps=json.dumps)
+    
+    return solcx
+
+def ensure_solc(solc_version):
+    """Return the Solidity compiler binary, installing it only when it is missing"""
+    if solc_version in _solc_executables:
+        return _solc_executables[solc_version]
+    
+    solcx = _solcx()
+    
+    try:
+        solc_binary = solcx.install.get_executable(solc_version)
+    except solcx.exceptions.SolcNotInstalled:
+        log.info("📦 Installing Solidity compiler %s...", solc_version)
+        solcx.install_solc(solc_version)
+        solc_binary = solcx.install.get_executable(solc_version)
+    
+    _solc_executables[solc_version] = solc_binary
+    return solc_binary
+
+def hash_source(contract_path):
+    """Return the sha256 of a contract source file"""
+    with open(contract_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def write_file(path, data):
+    """Write bytes to a file in as few write syscalls as possible"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def write_file_atomic(path, data):
+    """Write bytes to a temporary file and move it into place so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    write_file(tmp_path, data)
+    os.replace(tmp_path, path)
 
 class GitHubBSCDeployer:
     def __init__(self):
@@ -20,170 +85,311 @@ class GitHubBSCDeployer:
         if not self.private_key:
             raise ValueError("❌ PRIVATE_KEY environment variable is required")
         
-        # Setup Web3
-        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        # Setup Web3 (imported here so loading this module stays cheap)
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        from web3 import Web3
+        from eth_account import Account
+        
+        # Keep connections to the RPC node and BSCScan alive so each call skips the TLS handshake
+        self.http = requests.Session()
+        self.http.headers['Connection'] = 'keep-alive'
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            pool_block=False,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        
+        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url, session=self.http))
         self.account = Account.from_key(self.private_key)
         self.address = self.account.address
         
-        print(f"🔗 Connected to BSC Testnet")
-        print(f"📍 Deployer Address: {self.address}")
+        log.info("🔗 Connected to BSC Testnet")
+        log.info("📍 Deployer Address: %s", self.address)
         
         # Check connection
         if not self.w3.is_connected():
             raise Exception("❌ Failed to connect to BSC testnet")
         
-        # Check balance
-        balance = self.w3.eth.get_balance(self.address)
+        # Sign a throwaway transaction so the signing backend is loaded before deployment
+        self.account.sign_transaction({
+            'nonce': 0,
+            'gas': 21000,
+            'gasPrice': 1,
+            'to': self.address,
+            'value': 0,
+            'chainId': 97
+        })
+    
+    def fetch_account_state(self):
+        """Fetch balance and transaction fields needed for deployment in one round trip"""
+        balance, gas_price, nonce, chain_id, fee_history = self.rpc_batch([
+            ('eth_getBalance', [self.address, 'latest']),
+            ('eth_gasPrice', []),
+            ('eth_getTransactionCount', [self.address, 'pending']),
+            ('eth_chainId', []),
+            ('eth_feeHistory', [hex(5), 'latest', [50]]),
+        ], optional={'eth_feeHistory'})
+        balance = int(balance, 16)
+        self.gas_price = int(gas_price, 16)
+        self.nonce = int(nonce, 16)
+        self.chain_id = int(chain_id, 16)
+        
+        # Price with EIP-1559 fees when the chain reports a base fee, otherwise use legacy gas price
+        base_fees = (fee_history or {}).get('baseFeePerGas') or []
+        if base_fees:
+            base_fee = int(base_fees[-1], 16)
+            rewards = fee_history.get('reward') or [['0x0']]
+            # Never tip below what the node itself suggests
+            priority_fee = max(int(rewards[-1][0], 16), self.gas_price - base_fee)
+            self.fee_fields = {
+                'maxFeePerGas': base_fee * 2 + priority_fee,
+                'maxPriorityFeePerGas': priority_fee
+            }
+        else:
+            self.fee_fields = {'gasPrice': self.gas_price}
+        
         balance_bnb = self.w3.from_wei(balance, 'ether')
-        print(f"💰 Balance: {balance_bnb} BNB")
+        log.info("💰 Balance: %s BNB", balance_bnb)
         
         if balance == 0:
-            print("⚠️  Warning: No BNB balance detected!")
-            print("🔗 Get testnet BNB from: https://testnet.binance.org/faucet-smart")
+            log.warning("⚠️  Warning: No BNB balance detected!")
+            log.warning("🔗 Get testnet BNB from: https://testnet.binance.org/faucet-smart")
     
-    def compile_contract(self, contract_path):
+    def rpc_batch(self, calls, optional=()):
+        """Send several JSON-RPC calls to the node in one HTTP request"""
+        import requests
+        
+        payload = [
+            {'jsonrpc': '2.0', 'id': i, 'method': method, 'params': params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        
+        # Retry the whole batch on transient network errors
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                response = self.http.post(self.rpc_url, json=payload, timeout=30)
+                response.raise_for_status()
+                replies = response.json()
+                break
+            except requests.RequestException as e:
+                if attempt == max_retries - 1:
+                    raise e
+                log.warning("⚠️  Retry %s: Sending RPC batch...", attempt + 1)
+                time.sleep(2)
+        
+        if not isinstance(replies, list):
+            raise Exception(f"❌ RPC node rejected batch request: {replies}")
+        
+        # Replies may come back in any order, so match them up by id
+        replies_by_id = {reply.get('id'): reply for reply in replies}
+        results = []
+        for i, (method, _) in enumerate(calls):
+            reply = replies_by_id.get(i)
+            if reply is None or 'error' in reply:
+                error = reply['error'] if reply else 'no response'
+                # Methods the caller can live without come back as None instead of failing the batch
+                if method in optional:
+                    log.warning("⚠️  RPC call %s failed: %s", method, error)
+                    results.append(None)
+                    continue
+                raise Exception(f"❌ RPC call {method} failed: {error}")
+            results.append(reply['result'])
+        
+        return results
+    
+    def compile_contract(self, contract_path, include_runtime=False):
         """Compile Solidity contract with BSCScan-compatible settings"""
         try:
             # Use exact version for BSCScan compatibility
             solc_version = '0.8.19'
-            print(f"📦 Installing Solidity compiler {solc_version}...")
-            install_solc(solc_version)
-            set_solc_version(solc_version)
+            contract_name = 'MetacoreToken'
             
             # Read contract source
             with open(contract_path, 'r') as f:
                 contract_source = f.read()
             
-            print("🔨 Compiling contract with BSCScan-compatible settings...")
+            # Deployment only needs abi and bytecode; runtime bytecode costs an extra code generation pass
+            output_selection = ['abi', 'evm.bytecode.object']
+            if include_runtime:
+                output_selection.append('evm.deployedBytecode.object')
             
-            # Compile with exact settings for BSCScan verification
-            compiled_sol = compile_source(
-                contract_source,
-                output_values=['abi', 'bin', 'bin-runtime'],
-                solc_version=solc_version,
-                optimize=True,  # Enable optimization
-                optimize_runs=200,  # Standard optimization runs
-                evm_version=None  # Use default EVM version
-            )
+            # Standard JSON input with exact settings for BSCScan verification
+            source_name = os.path.basename(contract_path)
+            standard_json = {
+                'language': 'Solidity',
+                'sources': {source_name: {'content': contract_source}},
+                'settings': {
+                    'optimizer': {'enabled': True, 'runs': 200},  # Standard optimization runs
+                    'outputSelection': {'*': {'*': output_selection}}
+                }
+            }
             
-            # Get contract interface
-            contract_name = None
-            for key in compiled_sol.keys():
-                if 'MetacoreToken' in key:
-                    contract_name = key
-                    break
+            # Reuse a previous compilation of the same compiler version and input
+            cache_key = hashlib.sha256(
+                solc_version.encode() + json.dumps(standard_json, sort_keys=True).encode()
+            ).hexdigest()
+            cache_path = os.path.join(COMPILE_CACHE_DIR, f"{cache_key}.json")
             
-            if not contract_name:
-                contract_name = list(compiled_sol.keys())[0]
+            # A missing, partial or unparsable entry is just a cache miss
+            try:
+                with open(cache_path, 'r') as f:
+                    contract_interface = json.load(f)
+                if not {'abi', 'bin'} <= contract_interface.keys():
+                    contract_interface = None
+            except (OSError, ValueError, AttributeError):
+                contract_interface = None
             
-            contract_interface = compiled_sol[contract_name]
+            if contract_interface is not None:
+                log.info("♻️  Using cached compilation output...")
+            else:
+                solc_binary = ensure_solc(solc_version)
+                
+                log.info("🔨 Compiling contract with BSCScan-compatible settings...")
+                
+                # Pass the binary directly so solcx does not resolve the version again
+                compiled = _solcx().compile_standard(standard_json, solc_binary=solc_binary, allow_paths='.')
+                compiled_contracts = compiled['contracts'][source_name]
+                
+                # Get contract interface by exact name, so e.g. MetacoreTokenV2 can never match
+                compiled_contract = compiled_contracts.get(contract_name) or next(iter(compiled_contracts.values()))
+                contract_interface = {
+                    'abi': compiled_contract['abi'],
+                    'bin': compiled_contract['evm']['bytecode']['object']
+                }
+                if include_runtime:
+                    contract_interface['bin-runtime'] = compiled_contract['evm']['deployedBytecode']['object']
+                
+                os.makedirs(COMPILE_CACHE_DIR, exist_ok=True)
+                write_file_atomic(cache_path, orjson.dumps(contract_interface))
             
             # Store compilation info for verification
             self.compilation_info = {
                 'source_code': contract_source,
+                'source_hash': hash_source(contract_path),
+                'source_name': source_name,
+                'standard_json': json.dumps(standard_json),
                 'solc_version': solc_version,
                 'optimization_enabled': True,
                 'optimization_runs': 200,
-                'contract_name': 'MetacoreToken',
+                'contract_name': contract_name,
                 'license_type': 'MIT'
             }
             
-            print("✅ Contract compiled successfully with BSCScan-compatible settings!")
-            print(f"📋 Compiler: v{solc_version} (Optimization: Enabled, Runs: 200)")
+            # Parse the ABI once; deploy and verify both reuse this factory
+            self.contract_factory = self.w3.eth.contract(
+                abi=contract_interface['abi'],
+                bytecode=contract_interface['bin']
+            )
+            
+            log.info("✅ Contract compiled successfully with BSCScan-compatible settings!")
+            log.info("📋 Compiler: v%s (Optimization: Enabled, Runs: 200)", solc_version)
             
             return contract_interface
             
         except Exception as e:
-            print(f"❌ Compilation error: {e}")
+            log.error("❌ Compilation error: %s", e)
             raise
     
     def deploy_contract(self, contract_interface):
         """Deploy contract to BSC testnet"""
+        from web3.exceptions import TimeExhausted
+        
         try:
-            # Create contract instance
-            contract = self.w3.eth.contract(
-                abi=contract_interface['abi'],
-                bytecode=contract_interface['bin']
-            )
+            # Encode bytecode and constructor arguments once for both estimation and signing
+            deploy_data = self.contract_factory.constructor().data_in_transaction
+            
+            # Fees, nonce and chain id were fetched together with the balance
+            if 'maxFeePerGas' in self.fee_fields:
+                gas_price = self.fee_fields['maxFeePerGas']
+                log.info(
+                    "⛽ Max Fee: %s Gwei (Priority: %s Gwei)",
+                    self.w3.from_wei(gas_price, 'gwei'),
+                    self.w3.from_wei(self.fee_fields['maxPriorityFeePerGas'], 'gwei')
+                )
+            else:
+                gas_price = self.fee_fields['gasPrice']
+                log.info("⛽ Gas Price: %s Gwei", self.w3.from_wei(gas_price, 'gwei'))
+            
+            nonce = self.nonce
+            log.info("🔢 Nonce: %s", nonce)
             
-            # Get gas price with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    gas_price = self.w3.eth.gas_price
-                    break
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise e
-                    print(f"⚠️  Retry {attempt + 1}: Getting gas price...")
-                    time.sleep(2)
-            
-            print(f"⛽ Gas Price: {self.w3.from_wei(gas_price, 'gwei')} Gwei")
-            
-            # Get nonce
-            nonce = self.w3.eth.get_transaction_count(self.address)
-            print(f"🔢 Nonce: {nonce}")
-            
-            # Build constructor transaction
-            constructor_txn = contract.constructor().build_transaction({
+            # Estimate gas once per bytecode, with a 15% safety margin
+            bytecode_hash = hashlib.sha256(contract_interface['bin'].encode()).hexdigest()
+            gas_cache_path = os.path.join(COMPILE_CACHE_DIR, f"gas_{bytecode_hash}")
+            
+            # A missing or unreadable entry is just a cache miss
+            try:
+                with open(gas_cache_path, 'r') as f:
+                    gas_limit = int(f.read())
+            except (OSError, ValueError):
+                gas_limit = None
+            
+            if gas_limit is None:
+                gas_limit = int(self.w3.eth.estimate_gas({'from': self.address, 'data': deploy_data}) * 1.15)
+                os.makedirs(COMPILE_CACHE_DIR, exist_ok=True)
+                write_file_atomic(gas_cache_path, str(gas_limit).encode())
+            
+            log.info("⛽ Gas Limit: %s", format(gas_limit, ','))
+            
+            # Build constructor transaction (every field is known, so build_transaction is not needed)
+            constructor_txn = {
                 'from': self.address,
                 'nonce': nonce,
-                'gas': 2000000,
-                'gasPrice': gas_price,
-            })
+                'gas': gas_limit,
+                'chainId': self.chain_id,
+                'value': 0,
+                'data': deploy_data,
+                **self.fee_fields
+            }
             
-            print(f"💰 Estimated gas cost: {self.w3.from_wei(constructor_txn['gas'] * gas_price, 'ether')} BNB")
+            log.info("💰 Estimated gas cost: %s BNB", self.w3.from_wei(constructor_txn['gas'] * gas_price, 'ether'))
             
             # Sign transaction
             signed_txn = self.account.sign_transaction(constructor_txn)
             
             # Send transaction
-            print("🚀 Deploying contract...")
+            log.info("🚀 Deploying contract...")
             tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-            print(f"📝 Transaction Hash: {tx_hash.hex()}")
+            log.info("📝 Transaction Hash: %s", tx_hash.hex())
             
             # Wait for confirmation with timeout
-            print("⏳ Waiting for confirmation...")
-            start_time = time.time()
-            timeout = 300  # 5 minutes
-            
-            while time.time() - start_time < timeout:
-                try:
-                    tx_receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-                    if tx_receipt:
-                        break
-                except:
-                    pass
-                time.sleep(5)
-                print("⏳ Still waiting...")
-            else:
+            log.info("⏳ Waiting for confirmation...")
+            try:
+                tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300, poll_latency=1)
+            except TimeExhausted:
                 raise Exception("❌ Transaction timeout - check BSCScan for status")
             
             if tx_receipt.status == 1:
                 contract_address = tx_receipt.contractAddress
-                print("🎉 Contract deployed successfully!")
-                print(f"📍 Contract Address: {contract_address}")
-                print(f"⛽ Gas Used: {tx_receipt.gasUsed:,}")
-                print(f"🧱 Block Number: {tx_receipt.blockNumber}")
-                print(f"🔗 BSCScan: https://testnet.bscscan.com/address/{contract_address}")
+                log.info("🎉 Contract deployed successfully!")
+                log.info("📍 Contract Address: %s", contract_address)
+                log.info("⛽ Gas Used: %s", format(tx_receipt.gasUsed, ','))
+                log.info("🧱 Block Number: %s", tx_receipt.blockNumber)
+                log.info("🔗 BSCScan: https://testnet.bscscan.com/address/%s", contract_address)
                 
                 return contract_address, contract_interface['abi'], tx_receipt
             else:
                 raise Exception("❌ Contract deployment failed - transaction reverted")
                 
         except Exception as e:
-            print(f"❌ Deployment error: {e}")
+            log.error("❌ Deployment error: %s", e)
             raise
     
     def verify_on_bscscan(self, contract_address):
         """Attempt automatic verification on BSCScan"""
         if not self.bscscan_api_key:
-            print("⚠️  No BSCScan API key provided - skipping automatic verification")
+            log.warning("⚠️  No BSCScan API key provided - skipping automatic verification")
             self.print_manual_verification_guide(contract_address)
             return False
         
         try:
-            print("🔍 Attempting automatic verification on BSCScan...")
+            log.info("🔍 Attempting automatic verification on BSCScan...")
             
             # BSCScan testnet API endpoint
             api_url = "https://api-testnet.bscscan.com/api"
@@ -193,25 +399,34 @@ class GitHubBSCDeployer:
                 'module': 'contract',
                 'action': 'verifysourcecode',
                 'contractaddress': contract_address,
-                'sourceCode': self.compilation_info['source_code'],
-                'codeformat': 'solidity-single-file',
-                'contractname': self.compilation_info['contract_name'],
+                # Submit the exact compiler input so BSCScan does not have to infer settings
+                'sourceCode': self.compilation_info['standard_json'],
+                'codeformat': 'solidity-standard-json-input',
+                'contractname': f"{self.compilation_info['source_name']}:{self.compilation_info['contract_name']}",
                 'compilerversion': f"v{self.compilation_info['solc_version']}+commit.7dd6d404",
                 'optimizationUsed': '1' if self.compilation_info['optimization_enabled'] else '0',
                 'runs': str(self.compilation_info['optimization_runs']),
                 'licenseType': '3'  # MIT License
             }
             
-            response = requests.post(api_url, data=verification_data, timeout=30)
+            response = self.http.post(api_url, data=verification_data, timeout=30)
             result = response.json()
             
+            # Re-running against an already verified contract is still a success
+            if 'already verified' in str(result.get('result', '')).lower():
+                log.info("✅ Contract is already verified on BSCScan")
+                return True
+            
             if result['status'] == '1':
                 guid = result['result']
-                print(f"✅ Verification submitted! GUID: {guid}")
+                log.info("✅ Verification submitted! GUID: %s", guid)
                 
-                # Check verification status
-                for i in range(12):  # Check for 12 attempts (1 minute)
-                    time.sleep(5)
+                # Check verification status, starting fast and backing off to 10 s
+                max_polls = 8
+                delay = 1
+                for i in range(max_polls):
+                    time.sleep(delay)
+                    delay = min(delay * 1.6, 10)
                     status_data = {
                         'apikey': self.bscscan_api_key,
                         'module': 'contract',
@@ -220,28 +435,28 @@ class GitHubBSCDeployer:
                     }
                     
                     try:
-                        status_response = requests.get(api_url, params=status_data, timeout=10)
+                        status_response = self.http.get(api_url, params=status_data, timeout=10)
                         status_result = status_response.json()
                         
-                        if status_result['status'] == '1':
-                            print("🎉 Contract verified successfully on BSCScan!")
+                        if status_result['status'] == '1' or 'already verified' in status_result['result'].lower():
+                            log.info("🎉 Contract verified successfully on BSCScan!")
                             return True
                         elif status_result['result'] == 'Pending in queue':
-                            print(f"⏳ Verification pending... (attempt {i+1}/12)")
+                            log.info("⏳ Verification pending... (attempt %s/%s)", i+1, max_polls)
                         else:
-                            print(f"❌ Verification failed: {status_result['result']}")
+                            log.error("❌ Verification failed: %s", status_result['result'])
                             break
                     except Exception as e:
-                        print(f"⚠️  Status check error: {e}")
+                        log.warning("⚠️  Status check error: %s", e)
                         continue
                 
-                print("⚠️  Verification is taking longer than expected.")
+                log.warning("⚠️  Verification is taking longer than expected.")
                 
             else:
-                print(f"❌ Verification submission failed: {result.get('message', 'Unknown error')}")
+                log.error("❌ Verification submission failed: %s", result.get('message', 'Unknown error'))
                 
         except Exception as e:
-            print(f"❌ Verification error: {e}")
+            log.error("❌ Verification error: %s", e)
         
         # Fallback to manual verification guide
         self.print_manual_verification_guide(contract_address)
@@ -249,64 +464,112 @@ class GitHubBSCDeployer:
     
     def print_manual_verification_guide(self, contract_address):
         """Print detailed manual verification instructions"""
-        print("\n" + "="*80)
-        print("📋 MANUAL VERIFICATION GUIDE FOR BSCSCAN")
-        print("="*80)
-        print(f"🔗 Verification URL: https://testnet.bscscan.com/verifyContract?a={contract_address}")
-        print("\n📝 Step-by-step instructions:")
-        print("1. Click the verification URL above")
-        print("2. Select 'Via Solidity (Single file)'")
-        print("3. Use these EXACT settings:")
-        print("   ┌─────────────────────────────────────────────────────────┐")
-        print("   │ Compiler Type: Solidity (Single file)                  │")
-        print(f"   │ Compiler Version: v{self.compilation_info['solc_version']}+commit.7dd6d404              │")
-        print("   │ Open Source License Type: 3) MIT License (MIT)         │")
-        print("   │ Optimization: Yes                                       │")
-        print(f"   │ Runs: {self.compilation_info['optimization_runs']}                                           │")
-        print("   └─────────────────────────────────────────────────────────┘")
-        print("4. Copy the source code from 'verification_source.sol' file")
-        print("5. Leave Constructor Arguments EMPTY")
-        print("6. Click 'Verify and Publish'")
-        print("="*80)
+        # Warning level so the guide still shows with LOG_LEVEL=WARNING
+        log.warning("\n" + "="*80)
+        log.warning("📋 MANUAL VERIFICATION GUIDE FOR BSCSCAN")
+        log.warning("="*80)
+        log.warning("🔗 Verification URL: https://testnet.bscscan.com/verifyContract?a=%s", contract_address)
+        log.warning("\n📝 Step-by-step instructions:")
+        log.warning("1. Click the verification URL above")
+        log.warning("2. Select 'Via Solidity (Single file)'")
+        log.warning("3. Use these EXACT settings:")
+        log.warning("   ┌─────────────────────────────────────────────────────────┐")
+        log.warning("   │ Compiler Type: Solidity (Single file)                  │")
+        log.warning("   │ Compiler Version: v%s+commit.7dd6d404              │", self.compilation_info['solc_version'])
+        log.warning("   │ Open Source License Type: 3) MIT License (MIT)         │")
+        log.warning("   │ Optimization: Yes                                       │")
+        log.warning("   │ Runs: %s                                           │", self.compilation_info['optimization_runs'])
+        log.warning("   └─────────────────────────────────────────────────────────┘")
+        log.warning("4. Copy the source code from 'verification_source.sol' file")
+        log.warning("5. Leave Constructor Arguments EMPTY")
+        log.warning("6. Click 'Verify and Publish'")
+        log.warning("="*80)
+    
+    def load_previous_deployment(self, contract_path):
+        """Return the saved deployment result if it was built from the current source by this deployer on this chain"""
+        # A missing or unreadable result file just means there is nothing to re-verify
+        try:
+            with open(DEPLOYMENT_RESULT_PATH, 'rb') as f:
+                deployment_data = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning("⚠️  Ignoring unreadable %s: %s", DEPLOYMENT_RESULT_PATH, e)
+            return None
+        
+        if not isinstance(deployment_data, dict):
+            return None
+        if deployment_data.get('compilation_info', {}).get('source_hash') != hash_source(contract_path):
+            return None
+        
+        deployment_info = deployment_data.get('deployment_info', {})
+        if deployment_info.get('deployer_address') != self.address:
+            return None
+        if deployment_info.get('network_id') != self.w3.eth.chain_id:
+            return None
+        
+        return deployment_data
+    
+    def read_contract_info(self, contract_address):
+        """Read the token fields from a deployed contract, raising if they cannot be read"""
+        from eth_abi.exceptions import DecodingError
+        
+        # Normalize once so the contract calls below reuse the checksummed form
+        contract_address = self.w3.to_checksum_address(contract_address)
+        contract = self.contract_factory(address=contract_address)
+        
+        # Read all token fields with a single JSON-RPC batch of eth_calls
+        reads = [
+            ('name', 'string'),
+            ('symbol', 'string'),
+            ('decimals', 'uint8'),
+            ('totalSupply', 'uint256'),
+            ('owner', 'address')
+        ]
+        calls = [
+            ('eth_call', [{'to': contract_address, 'data': contract.encodeABI(fn_name=fn_name)}, 'latest'])
+            for fn_name, _ in reads
+        ]
+        
+        # rpc_batch already retries network errors, so only retry here when a node
+        # that has not caught up with the deploy block returns empty call data
+        max_retries = 3
+        for attempt in range(max_retries):
+            results = self.rpc_batch(calls)
+            try:
+                name, symbol, decimals, total_supply, owner = [
+                    self.w3.codec.decode([output_type], self.w3.to_bytes(hexstr=result))[0]
+                    for (_, output_type), result in zip(reads, results)
+                ]
+                owner = self.w3.to_checksum_address(owner)
+                break
+            except DecodingError as e:
+                if attempt == max_retries - 1:
+                    raise e
+                log.warning("⚠️  Retry %s: Verifying contract functions...", attempt + 1)
+                time.sleep(3)
+        
+        log.info("\n📋 Contract Function Verification:")
+        log.info("✅ Name: %s", name)
+        log.info("✅ Symbol: %s", symbol)
+        log.info("✅ Decimals: %s", decimals)
+        log.info("✅ Total Supply: %s %s", format(total_supply / (10**decimals), ',.0f'), symbol)
+        log.info("✅ Owner: %s", owner)
+        
+        return {
+            'name': name,
+            'symbol': symbol,
+            'decimals': decimals,
+            'totalSupply': str(total_supply),
+            'owner': owner
+        }
     
-    def verify_deployment(self, contract_address, abi):
+    def verify_deployment(self, contract_address):
         """Verify the deployed contract functions"""
         try:
-            contract = self.w3.eth.contract(address=contract_address, abi=abi)
-            
-            # Call contract functions with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    name = contract.functions.name().call()
-                    symbol = contract.functions.symbol().call()
-                    decimals = contract.functions.decimals().call()
-                    total_supply = contract.functions.totalSupply().call()
-                    owner = contract.functions.owner().call()
-                    break
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise e
-                    print(f"⚠️  Retry {attempt + 1}: Verifying contract functions...")
-                    time.sleep(3)
-            
-            print("\n📋 Contract Function Verification:")
-            print(f"✅ Name: {name}")
-            print(f"✅ Symbol: {symbol}")
-            print(f"✅ Decimals: {decimals}")
-            print(f"✅ Total Supply: {total_supply / (10**decimals):,.0f} {symbol}")
-            print(f"✅ Owner: {owner}")
-            
-            return {
-                'name': name,
-                'symbol': symbol,
-                'decimals': decimals,
-                'totalSupply': str(total_supply),
-                'owner': owner
-            }
-            
+            return self.read_contract_info(contract_address)
         except Exception as e:
-            print(f"❌ Contract function verification error: {e}")
+            log.error("❌ Contract function verification error: %s", e)
             return {
                 'name': 'Unknown',
                 'symbol': 'Unknown',
@@ -317,18 +580,21 @@ class GitHubBSCDeployer:
     
     def save_deployment_info(self, contract_address, abi, tx_receipt, contract_info, verification_attempted=False):
         """Save comprehensive deployment information"""
+        tx_hash = tx_receipt.transactionHash.hex()
+        deployment_time_ns = time.time_ns()
         deployment_data = {
             'deployment_info': {
                 'contract_address': contract_address,
-                'transaction_hash': tx_receipt.transactionHash.hex(),
+                'transaction_hash': tx_hash,
                 'block_number': tx_receipt.blockNumber,
                 'gas_used': tx_receipt.gasUsed,
                 'deployer_address': self.address,
                 'network': 'BSC Testnet',
-                'network_id': 97,
-                'deployment_time': datetime.utcnow().isoformat(),
+                'network_id': self.chain_id,
+                'deployment_time': datetime.fromtimestamp(deployment_time_ns / 1e9, tz=timezone.utc).isoformat(),
+                'deployment_time_ns': deployment_time_ns,
                 'bscscan_url': f"https://testnet.bscscan.com/address/{contract_address}",
-                'transaction_url': f"https://testnet.bscscan.com/tx/{tx_receipt.transactionHash.hex()}",
+                'transaction_url': f"https://testnet.bscscan.com/tx/{tx_hash}",
                 'verification_url': f"https://testnet.bscscan.com/verifyContract?a={contract_address}"
             },
             'contract_info': contract_info,
@@ -344,68 +610,140 @@ class GitHubBSCDeployer:
             'abi': abi
         }
         
+        self.write_deployment_files(deployment_data)
+        
+        return deployment_data
+    
+    def write_deployment_files(self, deployment_data):
+        """Write the deployment result and verification source to disk"""
         # Save deployment result
-        with open('deployment_result.json', 'w') as f:
-            json.dump(deployment_data, f, indent=2, default=str)
+        write_file_atomic(
+            DEPLOYMENT_RESULT_PATH,
+            orjson.dumps(deployment_data, default=str, option=orjson.OPT_INDENT_2)
+        )
         
         # Save source code for manual verification
-        with open('verification_source.sol', 'w') as f:
-            f.write(self.compilation_info['source_code'])
+        write_file('verification_source.sol', self.compilation_info['source_code'].encode('utf-8'))
+        
+        log.info("💾 Files saved:")
+        log.info("   📄 deployment_result.json - Complete deployment info")
+        log.info("   📄 verification_source.sol - Source code for BSCScan verification")
+    
+    def reverify_deployment(self, deployment_data):
+        """Re-run verification for a previous deployment without compiling or deploying"""
+        contract_address = deployment_data['deployment_info']['contract_address']
         
-        print("💾 Files saved:")
-        print("   📄 deployment_result.json - Complete deployment info")
-        print("   📄 verification_source.sol - Source code for BSCScan verification")
+        # Nothing at the saved address (e.g. the chain was reset), so it has to be deployed again
+        if not self.w3.eth.get_code(self.w3.to_checksum_address(contract_address)):
+            log.warning("⚠️  No contract code at %s - deploying again", contract_address)
+            return None
+        
+        self.compilation_info = deployment_data['compilation_info']
+        self.contract_factory = self.w3.eth.contract(abi=deployment_data['abi'])
+        
+        # Keep the saved contract info intact if the token fields cannot be read back
+        try:
+            deployment_data['contract_info'] = self.read_contract_info(contract_address)
+        except Exception as e:
+            raise Exception(f"❌ Could not re-verify previous deployment at {contract_address}: {e}")
+        
+        # Only resubmit to BSCScan if the saved deployment was not verified yet
+        if deployment_data['verification_info'].get('auto_verification_attempted'):
+            log.info("✅ Contract already verified on BSCScan - skipping resubmission")
+        else:
+            verification_attempted = self.verify_on_bscscan(contract_address)
+            deployment_data['verification_info']['auto_verification_attempted'] = verification_attempted
+        
+        self.write_deployment_files(deployment_data)
         
         return deployment_data
 
 def main():
-    print("🌟 GitHub Actions BSC Contract Deployer with Verification")
-    print("=" * 65)
+    # Set LOG_LEVEL=WARNING to keep only warnings and errors
+    log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+    valid_level = isinstance(logging.getLevelName(log_level), int)
+    logging.basicConfig(
+        level=log_level if valid_level else 'INFO',
+        format='%(message)s',
+        stream=sys.stdout
+    )
+    if not valid_level:
+        log.warning("⚠️  Unknown LOG_LEVEL %r - using INFO", log_level)
+    
+    log.info("🌟 GitHub Actions BSC Contract Deployer with Verification")
+    log.info("=" * 65)
     
     try:
+        # Fail fast, before the deployer pays for importing web3
+        if not os.getenv('PRIVATE_KEY'):
+            raise ValueError("❌ PRIVATE_KEY environment variable is required")
+        
         # Initialize deployer
         deployer = GitHubBSCDeployer()
         
-        # Compile contract
-        contract_interface = deployer.compile_contract('contracts/MetacoreToken.sol')
+        contract_path = 'contracts/MetacoreToken.sol'
         
-        # Deploy contract
-        contract_address, abi, tx_receipt = deployer.deploy_contract(contract_interface)
+        # Source unchanged since the saved deployment: verify it again instead of redeploying
+        previous_deployment = None if os.getenv('FORCE_DEPLOY') else deployer.load_previous_deployment(contract_path)
         
-        # Verify contract functions
-        contract_info = deployer.verify_deployment(contract_address, abi)
+        deployment_data = None
+        if previous_deployment:
+            log.info("♻️  Source unchanged since last deployment - re-verifying instead of deploying")
+            deployment_data = deployer.reverify_deployment(previous_deployment)
+        reverified = deployment_data is not None
         
-        # Attempt BSCScan verification
-        verification_attempted = deployer.verify_on_bscscan(contract_address)
+        if not reverified:
+            # Compile contract while the account state is fetched from the node
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                compile_future = executor.submit(deployer.compile_contract, contract_path)
+                deployer.fetch_account_state()
+                contract_interface = compile_future.result()
+            
+            # Deploy contract
+            contract_address, abi, tx_receipt = deployer.deploy_contract(contract_interface)
+            
+            # Verify contract functions
+            contract_info = deployer.verify_deployment(contract_address)
+            
+            # Attempt BSCScan verification
+            verification_attempted = deployer.verify_on_bscscan(contract_address)
+            
+            # Save deployment info
+            deployment_data = deployer.save_deployment_info(
+                contract_address, abi, tx_receipt, contract_info, verification_attempted
+            )
         
-        # Save deployment info
-        deployment_data = deployer.save_deployment_info(
-            contract_address, abi, tx_receipt, contract_info, verification_attempted
-        )
+        contract_address = deployment_data['deployment_info']['contract_address']
+        verification_attempted = deployment_data['verification_info']['auto_verification_attempted']
         
         # Set GitHub Actions outputs
         if os.getenv('GITHUB_ACTIONS'):
             github_output = os.getenv('GITHUB_OUTPUT')
             if github_output:
+                # Build all outputs first so they land in the file with one write
+                outputs = ''.join([
+                    f"contract_address={contract_address}\n",
+                    f"transaction_hash={deployment_data['deployment_info']['transaction_hash']}\n",
+                    f"bscscan_url=https://testnet.bscscan.com/address/{contract_address}\n",
+                    f"verification_url=https://testnet.bscscan.com/verifyContract?a={contract_address}\n",
+                    f"verification_attempted={verification_attempted}\n"
+                ])
                 with open(github_output, 'a') as f:
-                    f.write(f"contract_address={contract_address}\n")
-                    f.write(f"transaction_hash={tx_receipt.transactionHash.hex()}\n")
-                    f.write(f"bscscan_url=https://testnet.bscscan.com/address/{contract_address}\n")
-                    f.write(f"verification_url=https://testnet.bscscan.com/verifyContract?a={contract_address}\n")
-                    f.write(f"verification_attempted={verification_attempted}\n")
+                    f.write(outputs)
         
-        print(f"\n🎉 Deployment completed successfully!")
-        print(f"📍 Contract Address: {contract_address}")
+        if reverified:
+            log.info("\n🎉 Previous deployment re-verified successfully!")
+        else:
+            log.info("\n🎉 Deployment completed successfully!")
+        log.info("📍 Contract Address: %s", contract_address)
         
         if verification_attempted:
-            print("✅ Contract verification attempted automatically")
+            log.info("✅ Contract verification attempted automatically")
         else:
-            print("📋 Use the manual verification guide above to verify on BSCScan")
+            log.warning("📋 Use the manual verification guide above to verify on BSCScan")
         
     except Exception as e:
-        print(f"❌ Deployment failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Deployment failed: %s", e)
         exit(1)
 
 if __name__ == "__main__":